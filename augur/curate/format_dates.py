@@ -3,7 +3,9 @@ Format date fields to ISO 8601 dates (YYYY-MM-DD), where incomplete dates
 are masked with 'XX' (e.g. 2023 -> 2023-XX-XX).
 """
 import re
-from datetime import datetime
+from functools import lru_cache
+from datetime import date, datetime, time
+from typing import Callable, NamedTuple, Optional
 
 from augur.argparse_ import SKIP_AUTO_DEFAULT_IN_HELP
 from augur.errors import AugurError
@@ -12,6 +14,11 @@ from augur.types import DataErrorMethod
 from .format_dates_directives import YEAR_DIRECTIVES, YEAR_MONTH_DIRECTIVES, YEAR_MONTH_DAY_DIRECTIVES
 
 
+# Maximum number of distinct date strings whose formatted results are cached
+# during a single run
+FORMAT_DATE_CACHE_SIZE = 65536
+
+
 def register_parser(parent_subparsers):
     parser = parent_subparsers.add_parser("format-dates",
         parents=[parent_subparsers.shared_parser],
@@ -36,6 +43,10 @@ def register_parser(parent_subparsers):
         action="store_false",
         help="Do not mask dates with 'XXXX-XX-XX' and return original date string if date formatting failed. " +
              f"(default: False{SKIP_AUTO_DEFAULT_IN_HELP})")
+    optional.add_argument("--warn-each-failure",
+        action="store_true",
+        help="With '--failure-reporting warn', also print a warning for each failed date as it is encountered " +
+             "instead of only the summary of all failures at the end.")
 
     return parser
 
@@ -50,7 +61,7 @@ def directive_is_included(potential_directives, date_format):
 
     Parameters
     ----------
-    potential_directives: set[tuple[str, ...]]
+    potential_directives: frozenset[tuple[str, ...]]
         Set of potential directives to check
     date_format: str
         Date format string to check for directives
@@ -68,26 +79,309 @@ def directive_is_included(potential_directives, date_format):
     False
     >>> directive_is_included(potential_directives, '%%y-%m-%d')
     False
+    >>> directive_is_included(potential_directives, '%%%y-%m-%d')
+    True
+    >>> directive_is_included(potential_directives, 'y-m-d')
+    False
     >>> directive_is_included(potential_directives, '%y-%m-%d')
     True
     >>> directive_is_included(potential_directives, '%y-%m-%dT%H:%M:%SZ')
     True
     """
+    # Every directive starts with '%'
+    if '%' not in date_format:
+        return False
+
+    # Scan date_format once for all of its directives, then check the potential
+    # directives against them. Escaped directives are excluded since '%%' is
+    # consumed as a directive of its own (e.g. '%%Y' means literal '%Y' not a
+    # four digit year).
+    included_sub_directives = set(re.findall(r"%.", date_format, re.DOTALL))
+
     return any(
-        all(
-            # Exclude escaped directives (e.g. '%%Y' means literal '%Y' not a four digit year)
-            bool(re.search(f"(?<!%){re.escape(sub_directive)}", date_format))
-            for sub_directive in directive
-        )
+        included_sub_directives.issuperset(directive)
         for directive in potential_directives
     )
 
 
+# English month names as matched by the %b and %B directives of
+# datetime.strptime in the default C locale
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6, 'july': 7,
+    'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+
+# Zero-padded strings for months and days, indexed by their number
+TWO_DIGITS = tuple(f"{number:02d}" for number in range(100))
+
+# Regular expressions for the directives supported by the fast path.
+# These mirror the expressions used internally by datetime.strptime so that
+# the fast path accepts exactly the same date strings. Seconds stop at 59
+# because datetime.strptime fails for the leap seconds its expression allows.
+FAST_PATH_DIRECTIVES = {
+    '%Y': r"(?P<Y>\d\d\d\d)",
+    '%m': r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    '%d': r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    '%b': r"(?P<b>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)",
+    '%B': r"(?P<B>september|february|november|december|january|october|august|march|april|june|july|may)",
+    '%H': r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    '%M': r"(?P<M>[0-5]\d|\d)",
+    '%S': r"(?P<S>[0-5]\d|\d)",
+}
+
+# Common date formats that are parsed with precompiled regular expressions
+# instead of datetime.strptime
+FAST_PATH_FORMATS = [
+    '%Y',
+    '%Y-%m',
+    '%Y-%m-%d',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%m-%d',
+    '%b-%Y',
+    '%d-%b-%Y',
+]
+
+
+def parse_iso_date(date_string):
+    """
+    Parse *date_string* in the zero-padded ISO 8601 form YYYY-MM-DD with
+    :py:meth:`datetime.date.fromisoformat`, which is implemented in C and is
+    much faster than matching the equivalent '%Y-%m-%d' regular expression.
+
+    Parameters
+    ----------
+    date_string: str
+        Date string to parse
+
+    Returns
+    -------
+    datetime.date or None:
+        Parsed date or None if *date_string* is not a valid zero-padded
+        YYYY-MM-DD date. Date strings like '2020-1-5' that '%Y-%m-%d' still
+        accepts must be parsed by other means.
+
+
+    >>> parse_iso_date('2020-01-15')
+    datetime.date(2020, 1, 15)
+    >>> parse_iso_date('2020-1-15') is None
+    True
+    >>> parse_iso_date('2020-02-30') is None
+    True
+    """
+    if len(date_string) == 10 and date_string[4] == '-' and date_string[7] == '-':
+        try:
+            return date.fromisoformat(date_string)
+        except ValueError:
+            pass
+    return None
+
+
+def parse_iso_year_month(date_string):
+    """
+    Same as :py:func:`parse_iso_date`, but for the zero-padded form YYYY-MM.
+
+    >>> parse_iso_year_month('2020-01')
+    datetime.date(2020, 1, 1)
+    >>> parse_iso_year_month('2020-1') is None
+    True
+    """
+    if len(date_string) == 7 and date_string[4] == '-':
+        return parse_iso_date(date_string + '-01')
+    return None
+
+
+def parse_iso_datetime(date_string):
+    """
+    Same as :py:func:`parse_iso_date`, but for the zero-padded form
+    YYYY-MM-DDTHH:MM:SSZ.
+
+    >>> parse_iso_datetime('2020-01-15T23:59:59Z')
+    datetime.date(2020, 1, 15)
+    >>> parse_iso_datetime('2020-01-15T24:00:00Z') is None
+    True
+    """
+    if (len(date_string) == 20
+            and date_string[10] in 'Tt' and date_string[19] in 'Zz'
+            and date_string[13] == ':' and date_string[16] == ':'):
+        try:
+            time.fromisoformat(date_string[11:19])
+        except ValueError:
+            return None
+        return parse_iso_date(date_string[:10])
+    return None
+
+
+# Parsers for the zero-padded ISO 8601 forms of the most common date formats,
+# tried before the format's regular expression
+ISO_PARSERS = {
+    '%Y-%m-%d': parse_iso_date,
+    '%Y-%m': parse_iso_year_month,
+    '%Y-%m-%dT%H:%M:%SZ': parse_iso_datetime,
+}
+
+
+def date_mask(date_format):
+    """
+    Determine which of the year, month, and day fields parsed with
+    *date_format* can be used in a formatted date.
+
+    Parameters
+    ----------
+    date_format: str
+        Date format string to check for directives
+
+    Returns
+    -------
+    tuple[bool, bool, bool]:
+        Whether the year, month, and day fields are known
+
+
+    >>> date_mask('%Y-%m-%d')
+    (True, True, True)
+    >>> date_mask('%Y-%m')
+    (True, True, False)
+    >>> date_mask('%Y-%d')
+    (True, False, False)
+    >>> date_mask('%m-%d')
+    (False, False, False)
+    """
+    # If directives for all year,month,day fields are included in date_format,
+    # then use all of the parsed field strings
+    if directive_is_included(YEAR_MONTH_DAY_DIRECTIVES, date_format):
+        return (True, True, True)
+
+    # If directives only include year and month are included in date_format,
+    # then only use the parsed year and month field strings
+    if directive_is_included(YEAR_MONTH_DIRECTIVES, date_format):
+        return (True, True, False)
+
+    # If directives only include year in date_format, the only use the
+    # parsed year field string
+    if directive_is_included(YEAR_DIRECTIVES, date_format):
+        return (True, False, False)
+
+    return (False, False, False)
+
+
+def compile_fast_path(date_format):
+    """
+    Compile *date_format* to a regular expression that matches the same date
+    strings as :py:func:`datetime.strptime` would for *date_format*.
+
+    Parameters
+    ----------
+    date_format: str
+        Date format string to compile
+
+    Returns
+    -------
+    re.Pattern or None:
+        Compiled pattern with a named group per directive, or None if
+        *date_format* includes directives not supported by the fast path.
+
+
+    >>> compile_fast_path('%Y-%m-%d').fullmatch('2020-1-15').groupdict()
+    {'Y': '2020', 'm': '1', 'd': '15'}
+    >>> compile_fast_path('%Y-%j') is None
+    True
+    >>> compile_fast_path('%m/%b') is None
+    True
+    >>> compile_fast_path('%Y %m') is None
+    True
+    """
+    pattern = ""
+    groups = set()
+
+    for token in re.split(r"(%.)", date_format):
+        if token == '%%':
+            pattern += '%'
+        elif token.startswith('%'):
+            # Leave unsupported and repeated directives to datetime.strptime
+            directive_pattern = FAST_PATH_DIRECTIVES.get(token)
+            group = token[1]
+            if directive_pattern is None or group in groups:
+                return None
+            groups.add(group)
+            pattern += directive_pattern
+        elif '%' in token or any(char.isspace() for char in token):
+            # Stray '%' and whitespace have special handling in datetime.strptime
+            return None
+        else:
+            pattern += re.escape(token)
+
+    # Leave multiple directives for the month to datetime.strptime
+    if len(groups & {'m', 'b', 'B'}) > 1:
+        return None
+
+    return re.compile(pattern, re.IGNORECASE)
+
+
+class FormatInfo(NamedTuple):
+    """
+    Analysis of an expected *date_format* that only needs to happen once per
+    format instead of once per date string: its *iso_parser* from
+    :py:data:`ISO_PARSERS`, its fast path *pattern* from
+    :py:func:`compile_fast_path`, and its mask from :py:func:`date_mask`.
+    """
+    date_format: str
+    iso_parser: Optional[Callable[[str], Optional[date]]]
+    pattern: Optional[re.Pattern]
+    has_year: bool
+    has_month: bool
+    has_day: bool
+
+
+def compile_format(date_format):
+    """
+    Analyze a single *date_format* into a :py:class:`FormatInfo`.
+    """
+    return FormatInfo(
+        date_format,
+        ISO_PARSERS.get(date_format),
+        compile_fast_path(date_format),
+        *date_mask(date_format))
+
+
+# Precompiled fast paths for the common date formats
+_COMMON_FORMATS = {date_format: compile_format(date_format) for date_format in FAST_PATH_FORMATS}
+
+
+def compile_expected_formats(expected_formats):
+    """
+    Analyze each of the *expected_formats* so the analysis can be reused for
+    every date string formatted with :py:func:`format_date`.
+
+    Parameters
+    ----------
+    expected_formats: list[str]
+        List of expected date formats
+
+    Returns
+    -------
+    list[FormatInfo]:
+        Analyzed formats, in the same order as *expected_formats*
+
+
+    >>> [(f.date_format, f.has_year, f.has_month, f.has_day) for f in compile_expected_formats(['%Y', '%Y-%j'])]
+    [('%Y', True, False, False), ('%Y-%j', True, True, True)]
+    """
+    return [
+        _COMMON_FORMATS.get(date_format) or compile_format(date_format)
+        for date_format in expected_formats
+    ]
+
+
 def format_date(date_string, expected_formats):
     """
     Format *date_string* to ISO 8601 date (YYYY-MM-DD) by trying to parse it
     as one of the provided *expected_formats*.
 
+    When formatting many date strings with the same formats, use
+    :py:func:`compile_expected_formats` once and pass its result to
+    :py:func:`format_date_compiled` instead.
+
     Parameters
     ----------
     date_string: str
@@ -120,41 +414,97 @@ def format_date(date_string, expected_formats):
     '2020-01-15'
     >>> format_date("2020-01-15T00:00:00Z", expected_formats)
     '2020-01-15'
+    >>> format_date("2020-02-30", expected_formats) is None
+    True
+    >>> format_date("15-JAN-2020", ['%d-%b-%Y'])
+    '2020-01-15'
+    >>> format_date("2020-001", ['%Y-%j'])
+    '2020-01-01'
+    >>> format_date("0999-12", expected_formats)
+    '0999-12-XX'
     """
+    return format_date_compiled(date_string, compile_expected_formats(expected_formats))
 
-    for date_format in expected_formats:
+
+def parse_date(date_string, expected_format):
+    """
+    Parse *date_string* as the compiled *expected_format*, using the fastest
+    of its available parsers that can handle *date_string*.
+
+    Parameters
+    ----------
+    date_string: str
+        Date string to parse
+    expected_format: FormatInfo
+        Compiled expected format from :py:func:`compile_format`
+
+    Returns
+    -------
+    datetime.date or None:
+        Parsed date or None if *date_string* does not match *expected_format*.
+    """
+    if expected_format.iso_parser is not None:
+        parsed_date = expected_format.iso_parser(date_string)
+        if parsed_date is not None:
+            return parsed_date
+
+    pattern = expected_format.pattern
+
+    if pattern is None:
         try:
-            parsed_date = datetime.strptime(date_string, date_format)
+            return datetime.strptime(date_string, expected_format.date_format)
         except ValueError:
-            continue
+            return None
 
-        # Default to date masked as 'XXXX-XX-XX' so we don't return incorrect dates
-        year_string = 'XXXX'
-        month_string = day_string = 'XX'
+    match = pattern.fullmatch(date_string)
+    if match is None:
+        return None
 
-        parsed_year_string = str(parsed_date.year)
-        parsed_month_string = str(parsed_date.month).zfill(2)
-        parsed_day_string = str(parsed_date.day).zfill(2)
+    fields = match.groupdict()
+    month_name = fields.get('b') or fields.get('B')
 
-        # If directives for all year,month,day fields are included in date_format,
-        # then use all of the parsed field strings
-        if directive_is_included(YEAR_MONTH_DAY_DIRECTIVES, date_format):
-            year_string = parsed_year_string
-            month_string = parsed_month_string
-            day_string = parsed_day_string
+    # Defaults match the ones used by datetime.strptime
+    year = int(fields.get('Y') or 1900)
+    month = MONTHS[month_name.lower()] if month_name else int(fields.get('m') or 1)
+    day = int(fields.get('d') or 1)
 
-        # If directives only include year and month are included in date_format,
-        # then only use the parsed year and month field strings
-        elif directive_is_included(YEAR_MONTH_DIRECTIVES, date_format):
-            year_string = parsed_year_string
-            month_string = parsed_month_string
+    # Validate the date, e.g. reject February 30th
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
 
-        # If directives only include year in date_format, the only use the
-        # parsed year field string
-        elif directive_is_included(YEAR_DIRECTIVES, date_format):
-            year_string = parsed_year_string
 
-        return f"{year_string}-{month_string}-{day_string}"
+def format_date_compiled(date_string, compiled_formats):
+    """
+    Same as :py:func:`format_date`, but with *compiled_formats* from
+    :py:func:`compile_expected_formats`.
+
+    >>> date_string = "2020-01-15"
+    >>> format_date_compiled(date_string, compile_expected_formats(['%Y-%m-%d'])) is date_string
+    True
+    """
+    for expected_format in compiled_formats:
+        parsed_date = parse_date(date_string, expected_format)
+        if parsed_date is None:
+            continue
+
+        # Default to date masked as 'XXXX-XX-XX' so we don't return incorrect dates
+        if expected_format.has_year:
+            # Zero-pad years before 1000 to the four digits required by ISO 8601
+            year = parsed_date.year
+            year_string = str(year) if year >= 1000 else f"{year:04d}"
+        else:
+            year_string = 'XXXX'
+
+        month_string = TWO_DIGITS[parsed_date.month] if expected_format.has_month else 'XX'
+        day_string = TWO_DIGITS[parsed_date.day] if expected_format.has_day else 'XX'
+
+        formatted_date_string = f"{year_string}-{month_string}-{day_string}"
+
+        # Return date strings that are already formatted as-is, so callers
+        # can check for changes by identity
+        return date_string if formatted_date_string == date_string else formatted_date_string
 
     return None
 
@@ -162,39 +512,81 @@ def format_date(date_string, expected_formats):
 def run(args, records):
     failures = []
     failure_reporting = args.failure_reporting
-    for index, record in enumerate(records):
-        record = record.copy()
-        record_id = index
-
-        for field in args.date_fields:
+    warn_each_failure = failure_reporting is DataErrorMethod.WARN and args.warn_each_failure
+    mask_failure = args.mask_failure
+    compiled_formats = compile_expected_formats(args.expected_date_formats)
+    date_fields = tuple(args.date_fields)
+
+    # Records tend to share a small set of distinct date strings, so only
+    # format each distinct date string once while keeping memory bounded.
+    @lru_cache(maxsize=FORMAT_DATE_CACHE_SIZE)
+    def cached_format_date(date_string):
+        return format_date_compiled(date_string, compiled_formats)
+
+    def handle_failure(record_id, field, date_string):
+        """
+        Report the failure to format *date_string* per the failure reporting
+        method and return the date string to use instead, if any.
+        """
+        if failure_reporting is not DataErrorMethod.SILENT:
+            failure_message = f"Unable to format date string {date_string!r} in field {field!r} of record {record_id!r}."
+            if failure_reporting is DataErrorMethod.ERROR_FIRST:
+                raise AugurError(failure_message)
+
+            # Failures are summarized at the end rather than warned
+            # about one by one, which is slow for many failures
+            if warn_each_failure:
+                print_err(f"WARNING: {failure_message}")
+
+            # Keep track of failures for final summary
+            failures.append((record_id, field, date_string))
+
+        return "XXXX-XX-XX" if mask_failure else None
+
+    # Formatting a single date field is the common case, so handle it
+    # without the loop over fields
+    if len(date_fields) == 1:
+        field = date_fields[0]
+
+        for record_id, record in enumerate(records):
             date_string = record.get(field)
 
-            if not date_string:
-                continue
+            if date_string:
+                formatted_date_string = cached_format_date(date_string)
+                if formatted_date_string is None:
+                    formatted_date_string = handle_failure(record_id, field, date_string)
 
-            formatted_date_string = format_date(date_string, args.expected_date_formats)
-            if formatted_date_string is None:
-                # Mask failed date formatting before processing error methods
-                # to ensure failures are masked even when failures are "silent"
-                if args.mask_failure:
-                    record[field] = "XXXX-XX-XX"
+                # Cached results may be equal to but not identical with date_string
+                if formatted_date_string is not None and formatted_date_string != date_string:
+                    record = record.copy()
+                    record[field] = formatted_date_string
 
-                if failure_reporting is DataErrorMethod.SILENT:
+            yield record
+
+    else:
+        for record_id, record in enumerate(records):
+            # Copy the record only once one of its date fields changes
+            formatted_record = None
+
+            for field in date_fields:
+                date_string = record.get(field)
+
+                if not date_string:
                     continue
 
-                failure_message = f"Unable to format date string {date_string!r} in field {field!r} of record {record_id!r}."
-                if failure_reporting is DataErrorMethod.ERROR_FIRST:
-                    raise AugurError(failure_message)
+                formatted_date_string = cached_format_date(date_string)
+                if formatted_date_string is None:
+                    formatted_date_string = handle_failure(record_id, field, date_string)
 
-                if failure_reporting is DataErrorMethod.WARN:
-                    print_err(f"WARNING: {failure_message}")
+                # Cached results may be equal to but not identical with date_string
+                if formatted_date_string is None or formatted_date_string == date_string:
+                    continue
 
-                # Keep track of failures for final summary
-                failures.append((record_id, field, date_string))
-            else:
-                record[field] = formatted_date_string
+                if formatted_record is None:
+                    formatted_record = record.copy()
+                formatted_record[field] = formatted_date_string
 
-        yield record
+            yield record if formatted_record is None else formatted_record
 
     if failure_reporting is not DataErrorMethod.SILENT and failures:
         failure_message = (
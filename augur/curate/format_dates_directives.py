@@ -8,7 +8,7 @@ week = {'%U', '%W'}
 day_of_week = {'%A', '%a', '%w', '%u'}
 
 # Set of directives that can be converted to complete date with year, month, and day
-YEAR_MONTH_DAY_DIRECTIVES = (
+YEAR_MONTH_DAY_DIRECTIVES = frozenset(
     # Locale's full date representation
     {('%c',),('%x',)} |
     # Dates with ISO 8601 week dates for year ('%G' is NOT interchangeable with '%Y'), ISO 8601 week ('%V'), and weekdays
@@ -22,7 +22,7 @@ YEAR_MONTH_DAY_DIRECTIVES = (
 )
 
 # Set of directives that can be converted to incomplete dates, missing the day
-YEAR_MONTH_DIRECTIVES = set(product(year, month))
+YEAR_MONTH_DIRECTIVES = frozenset(product(year, month))
 
 # Set of directives that can be converted to incomplete dates, missing the month and day
-YEAR_DIRECTIVES = set(product(year))
+YEAR_DIRECTIVES = frozenset(product(year))
@@ -33,7 +33,7 @@ The LICENSE file included in ID3C's repo is copied below verbatim::
 """
 import json
 from datetime import datetime
-from typing import Iterable
+from typing import Dict, Iterable
 from uuid import UUID
 
 
@@ -41,7 +41,7 @@ def as_json(value):
     """
     Converts *value* to a JSON string using our custom :class:`JsonEncoder`.
     """
-    return json.dumps(value, allow_nan = False, cls = JsonEncoder)
+    return _JSON_ENCODER.encode(value)
 
 
 def load_json(value):
@@ -110,6 +110,11 @@ class JsonEncoder(json.JSONEncoder):
             return super().default(value)
 
 
+# Shared by as_json() so a new encoder isn't created for each value, which adds
+# up when dumping many records (e.g. NDJSON)
+_JSON_ENCODER = JsonEncoder()
+
+
 class JSONDecodeError(json.JSONDecodeError):
     """
     Subclass of :class:`json.JSONDecodeError` which contextualizes the
@@ -201,6 +206,19 @@ def shorten_as_json(value, length, placeholder) -> str:
     if length < min_length:
         raise ValueError(f"maximum length ({length}) must be two greater than length of placeholder ({len(placeholder)}), i.e. at least {min_length}")
 
+    # Containers and strings can be arbitrarily large (e.g. a whole tree in a
+    # validation error), so only encode as much of them as will be shown.
+    # Their closing delimiter is known without encoding the rest.
+    closing_delimiters: Dict[type, str] = {dict: '}', list: ']', tuple: ']', str: '"'}
+
+    if type(value) in closing_delimiters:
+        json_value = ""
+        for chunk in _JSON_ENCODER.iterencode(value):
+            json_value += chunk
+            if len(json_value) > length:
+                return json_value[0:length - len(placeholder) - 1] + placeholder + closing_delimiters[type(value)]
+        return json_value
+
     json_value = as_json(value)
 
     if len(json_value) > length:
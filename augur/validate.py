@@ -4,6 +4,7 @@ Validate files related to augur consumption or export.
 
 import sys
 from collections import defaultdict
+from functools import lru_cache
 import json
 import jsonschema
 import jsonschema.exceptions
@@ -16,6 +17,18 @@ from augur.io.print import print_err
 from augur.io.json import shorten_as_json
 from .validate_export import verifyMainJSONIsInternallyConsistent, verifyMetaAndOrTreeJSONsAreInternallyConsistent
 
+try:
+    # Optional faster JSON decoder for large datasets
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    # Optional faster JSON schema validation for large datasets
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 def fatal(message):
     print("FATAL ERROR: {}".format(message))
     sys.exit(2)
@@ -28,6 +41,18 @@ def load_json_schema(path, refs=None):
     '''
     Load a JSON schema from the augur included set of schemas
     (located in augur/data)
+
+    Loaded schemas are cached, so loading the same schema again (e.g. once per
+    node data file) doesn't re-read, re-check, and re-compile it.
+    '''
+    return _load_json_schema(path, tuple(refs.items()) if refs else ())
+
+
+@lru_cache()
+def _load_json_schema(path, refs):
+    '''
+    Uncached :py:func:`load_json_schema`, with *refs* as a tuple of
+    ($ref URL, path) pairs so it's hashable.
     '''
     try:
         with as_file(path) as file, open(file, "r", encoding = "utf-8") as fh:
@@ -44,7 +69,7 @@ def load_json_schema(path, refs=None):
     if refs:
         # Make the validator aware of additional schemas
         schema_store = dict()
-        for k, v in refs.items():
+        for k, v in refs:
             with as_file(v) as file, open(file, "r", encoding = "utf-8") as fh:
                 schema_store[k] = json.load(fh)
         resolver = jsonschema.RefResolver.from_schema(schema,store=schema_store)
@@ -63,17 +88,120 @@ def load_json_schema(path, refs=None):
                         "and update the appropriate schema_store as needed." )
     schema_validator.resolver.resolve_remote = resolve_remote
 
+    if fastjsonschema is not None:
+        compiled_validator = compile_json_schema(path, refs)
+        if compiled_validator is not None:
+            return CompiledValidator(schema_validator, compiled_validator)
+
     return schema_validator
 
 
+def compile_json_schema(path, refs=()):
+    """
+    Compile the JSON schema at *path* (relative to augur/data) with
+    :py:mod:`fastjsonschema`, resolving the ($ref URL, path) pairs in *refs*
+    to local schemas.
+
+    Returns None if the schema can't be compiled, in which case only the
+    :py:mod:`jsonschema` validator should be used.
+    """
+    def load(path):
+        with as_file(path) as file, open(file, "r", encoding = "utf-8") as fh:
+            return json.load(fh)
+
+    schema_store = {url: load(ref_path) for url, ref_path in refs}
+
+    # Like the jsonschema validator, never access the network for $ref URLs
+    def resolve_remote(url):
+        return schema_store[url]
+
+    try:
+        # Don't apply defaults or check formats, matching the jsonschema
+        # validator which does neither
+        return fastjsonschema.compile(
+            load(path),
+            handlers = {"http": resolve_remote, "https": resolve_remote},
+            use_default = False,
+            use_formats = False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+class CompiledValidator:
+    """
+    Wraps a :py:mod:`jsonschema` *validator* so that documents are first
+    checked with a much faster *compiled* validator from
+    :py:func:`compile_json_schema`.
+
+    Only when the compiled validator rejects a document is the
+    :py:mod:`jsonschema` validator used to find and report all the errors,
+    so the errors reported are always the same as without the compiled
+    validator.
+    """
+    def __init__(self, validator, compiled):
+        self.validator = validator
+        self.compiled = compiled
+
+    def __getattr__(self, name):
+        return getattr(self.validator, name)
+
+    def is_valid(self, instance):
+        return next(self.iter_errors(instance), None) is None
+
+    def iter_errors(self, instance):
+        try:
+            self.compiled(instance)
+        except fastjsonschema.JsonSchemaException:
+            yield from self.validator.iter_errors(instance)
+
+    def validate(self, instance):
+        try:
+            self.compiled(instance)
+        except fastjsonschema.JsonSchemaException:
+            self.validator.validate(instance)
+
+
+# Used to look for runs of digits at C speed, see decode_json()
+DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+LONG_DIGITS = b"0" * 19
+
 def load_json(path):
     with open(path, 'rb') as fh:
         try:
-            jsonToValidate = json.load(fh)
+            jsonToValidate = decode_json(fh)
         except json.JSONDecodeError:
             raise ValidateError("Supplied JSON to validate ({}) is not a valid JSON".format(path))
     return jsonToValidate
 
+def decode_json(fh):
+    """
+    Decode JSON from the binary file handle *fh*, using :py:mod:`orjson` if
+    it's installed since it's much faster and uses less memory than
+    :py:mod:`json` for large datasets.
+
+    orjson is stricter than :py:mod:`json` (e.g. it rejects ``NaN``), so
+    documents it can't decode are decoded again with :py:mod:`json` to accept
+    the same documents as before.
+
+    orjson also decodes integers outside of the 64-bit range as floats,
+    losing precision, so documents which may contain such integers (i.e.
+    have runs of 19 or more digits) are decoded with :py:mod:`json` too.
+
+    >>> from io import BytesIO
+    >>> decode_json(BytesIO(b'[18446744073709551616, -9223372036854775809]'))
+    [18446744073709551616, -9223372036854775809]
+    """
+    if orjson is not None:
+        data = fh.read()
+        if LONG_DIGITS not in data.translate(DIGITS_TO_ZERO):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(data)
+
+    return json.load(fh)
+
 def validate_json(jsonToValidate, schema, filename):
     # See <https://python-jsonschema.readthedocs.io/en/v3.2.0/errors/> and
     # <https://python-jsonschema.readthedocs.io/en/v3.2.0/validate/> for the
@@ -7,44 +7,70 @@ and refactored over time.
 import sys
 from collections import defaultdict
 
-def ensure_no_duplicate_names(root, ValidateError):
+
+class ValidationWarnings:
     """
-    Check that all node names are identical, which is required for auspice (v2) JSONs.
+    Collects the warnings found while checking a JSON for internal
+    consistency. Each distinct warning is kept once, and :py:meth:`show`
+    writes all of them to stderr at once instead of one write per warning.
     """
-    names = set()
-    def recurse(node):
-        if node["name"] in names:
-            raise ValidateError(f"Node {node['name']} appears multiple times in the tree.")
-        names.add(node["name"])
-        if "children" in node:
-            [recurse(child) for child in node["children"]]
-    recurse(root)
+    def __init__(self):
+        self.seen = set()
+        self.messages = []
+
+    def add(self, message):
+        if message not in self.seen:
+            self.seen.add(message)
+            self.messages.append(message)
+
+    def __bool__(self):
+        return bool(self.messages)
+
+    def show(self):
+        if self.messages:
+            sys.stderr.write("".join(f"\tWARNING:  {message}\n" for message in self.messages))
 
 
-def collectTreeAttrsV2(root, warn):
+def collectTreeV2(root, ValidateError):
     """
-    Collect all keys specified on `node["node_attrs"]` throughout the tree
-    and the values associated with them. Note that this will only look at
-    attributes which are themselves objects with a `value` property.
-    I.e. a node attribute `node["node_attrs"]["div"] -> numeric` will not
-    be collected.
+    Collect everything the consistency checks need from the tree in a single
+    traversal, checking that all node names are unique along the way, which
+    is required for auspice (v2) JSONs.
     Returns a tuple.
     return[0]: dict of `node_attr_property` -> x, where x is a dict with
-    keys `count` -> INT, `values` -> SET, `onAllNodes` -> BOOL.
+    keys `count` -> INT, `values` -> SET, `onAllNodes` -> BOOL. Note that
+    this will only look at attributes which are themselves objects with a
+    `value` property. I.e. a node attribute `node["node_attrs"]["div"] ->
+    numeric` will not be collected.
     return[1]: INT of number of terminal nodes in tree
+    return[2]: SET of all genes specified in the "mutations" objects,
+    excluding "nuc"
+    return[3]: SET of all branch labels
     """
+    names = set()
     seen = defaultdict(lambda: {"count": 0, "values": set(), "onAllNodes": False})
+    genes = set()
+    labels = set()
     num_nodes, num_terminal = (0, 0)
     def recurse(node):
         nonlocal num_nodes, num_terminal
+        if node["name"] in names:
+            raise ValidateError(f"Node {node['name']} appears multiple times in the tree.")
+        names.add(node["name"])
         num_nodes += 1
         for prop, info in node.get("node_attrs", {}).items():
             if not isinstance(info, dict) or "value" not in info:
                 continue
             seen[prop]["count"] += 1
             seen[prop]["values"].add(info["value"])
+        branch_attrs = node.get("branch_attrs", {})
+        mutations = branch_attrs.get("mutations", False)
+        if mutations:
+            genes.update(mutations.keys())
+        labels.update(branch_attrs.get("labels", {}).keys())
         if "children" in node:
-            [recurse(child) for child in node["children"]]
+            for child in node["children"]:
+                recurse(child)
         else:
             num_terminal += 1
     recurse(root)
@@ -53,32 +79,9 @@ def collectTreeAttrsV2(root, warn):
         if data["count"] == num_nodes:
             data["onAllNodes"] = True
 
-    return(seen, num_terminal)
-
-
-def collectMutationGenes(root):
-    """
-    Returns a set of all genes specified in the tree in the "aa_muts" objects
-    """
-    genes = set()
-    def recurse(node):
-        mutations = node.get("branch_attrs", {}).get("mutations", False)
-        if mutations:
-            genes.update(mutations.keys())
-        if "children" in node:
-            [recurse(child) for child in node["children"]]
-    recurse(root)
     genes -= {"nuc"}
-    return genes
+    return(seen, num_terminal, genes, labels)
 
-def collectBranchLabels(root):
-    labels = set()
-    def recurse(node):
-        labels.update(node.get("branch_attrs", {}).get("labels", {}).keys())
-        if "children" in node:
-            [recurse(child) for child in node["children"]]
-    recurse(root)
-    return labels
 
 def verifyMainJSONIsInternallyConsistent(data, ValidateError):
     """
@@ -88,21 +91,27 @@ def verifyMainJSONIsInternallyConsistent(data, ValidateError):
     however this function performs tests which are not possible to
     define in the schema (as of JSON schema v6).
     """
-    warnings = False
-    def warn(msg):
-        nonlocal warnings
-        warnings = True
-        print("\tWARNING: ", msg, file=sys.stderr)
-
     print("Validating that the JSON is internally consistent...")
 
-    ensure_no_duplicate_names(data["tree"], ValidateError)
+    warnings = ValidationWarnings()
+    try:
+        checkMainJSONIsInternallyConsistent(data, ValidateError, warnings.add)
+    finally:
+        warnings.show()
+
+    return not warnings
+
+
+def checkMainJSONIsInternallyConsistent(data, ValidateError, warn):
+    """
+    Run the checks of :py:func:`verifyMainJSONIsInternallyConsistent`,
+    calling *warn* with each warning found.
+    """
+    tree_traits, _, genes_with_mutations, labels = collectTreeV2(data["tree"], ValidateError)
 
     if "entropy" in data["meta"]["panels"] and "genome_annotations" not in data["meta"]:
         warn("The entropy panel has been specified but annotations don't exist.")
 
-    tree_traits, _ = collectTreeAttrsV2(data["tree"], warn)
-
     if "geo_resolutions" in data["meta"]:
         for geo_res in data["meta"]["geo_resolutions"]:
             geo_name = geo_res["key"]
@@ -159,7 +168,6 @@ def verifyMainJSONIsInternallyConsistent(data, ValidateError):
             if filter not in tree_traits:
                 warn("The filter \"{}\" does not appear as a property on any tree nodes.".format(filter))
 
-    genes_with_mutations = collectMutationGenes(data['tree'])
     if len(genes_with_mutations):
         if "genome_annotations" not in data["meta"]:
             warn("The tree defined mutations on genes {}, but annotations aren't defined in the meta JSON.".format(", ".join(genes_with_mutations)))
@@ -170,12 +178,9 @@ def verifyMainJSONIsInternallyConsistent(data, ValidateError):
 
     default_branch_label = data.get("meta").get("display_defaults", {}).get("branch_label")
     if default_branch_label and default_branch_label.lower() != "none":
-        labels = collectBranchLabels(data['tree'])
         if not default_branch_label in labels:
             warn("Default label to display \"{}\" isn't found anywhere on the tree!".format(default_branch_label))
 
-    return not warnings
-
 
 def collectTreeAttrsV1(root):
     """
@@ -226,14 +231,22 @@ def verifyMetaAndOrTreeJSONsAreInternallyConsistent(meta_json, tree_json, Valida
     Check all possible sources of conflict internally & between the metadata & tree JSONs
     This is only that which cannot be checked by the schemas
     """
-    warnings = False
-    def warn(msg):
-        nonlocal warnings
-        warnings = True
-        print("\tWARNING: ", msg, file=sys.stderr)
+    print("Validating that meta + tree JSONs are internally consistent...")
 
+    warnings = ValidationWarnings()
+    try:
+        checkMetaAndOrTreeJSONsAreInternallyConsistent(meta_json, tree_json, ValidateError, warnings.add)
+    finally:
+        warnings.show()
 
-    print("Validating that meta + tree JSONs are internally consistent...")
+    return not warnings
+
+
+def checkMetaAndOrTreeJSONsAreInternallyConsistent(meta_json, tree_json, ValidateError, warn):
+    """
+    Run the checks of :py:func:`verifyMetaAndOrTreeJSONsAreInternallyConsistent`,
+    calling *warn* with each warning found.
+    """
     mj = meta_json
 
     if "panels" in mj and "entropy" in mj["panels"] and "annotations" not in mj:
@@ -252,8 +265,8 @@ def verifyMetaAndOrTreeJSONsAreInternallyConsistent(meta_json, tree_json, Valida
                         warn("\"{}\", a value of the geographic resolution \"{}\", does not appear as a value of attr->{} on any tree nodes.".format(geoValue, geoName, geoName))
                 for geoValue in treeAttrs[geoName]["values"]:
                     if geoValue not in mj["geo"][geoName]:
-                        warn("\"{}\", a value of the geographic resolution \"{}\", appears in the tree but not in the metadata.".format(geoValue, geoName))
-                        warn("\tThis will cause transmissions & demes involving this location not to be displayed in Auspice")
+                        warn("\"{}\", a value of the geographic resolution \"{}\", appears in the tree but not in the metadata."
+                            "\n\t\tThis will cause transmissions & demes involving this location not to be displayed in Auspice".format(geoValue, geoName))
 
 
     if "color_options" in mj:
@@ -290,5 +303,3 @@ def verifyMetaAndOrTreeJSONsAreInternallyConsistent(meta_json, tree_json, Valida
             for gene in genes_with_aa_muts:
                 if gene not in mj["annotations"]:
                     warn("The tree defined AA mutations on gene {} which doesn't appear in the metadata annotations object.".format(gene))
-
-    return not warnings
@@ -71,10 +71,12 @@ setuptools.setup(
         'dev': [
             "cram >=0.7",
             "deepdiff >=4.3.2",
+            "fastjsonschema >=2.15",
             "flake8",
             "freezegun >=0.3.15",
             "mypy",
             "nextstrain-sphinx-theme >=2022.5",
+            "orjson >=3.0",
             "pandas-stubs >=1.0.0, ==1.*",
             "pylint >=1.7.6",
             "pytest >=5.4.1",
@@ -92,7 +94,12 @@ setuptools.setup(
             "types-setuptools",
             "wheel >=0.32.3",
             "ipdb >=0.10.1"
-        ]
+        ],
+        # Optional dependencies which speed up working with large datasets
+        'fast': [
+            "fastjsonschema >=2.15",
+            "orjson >=3.0",
+        ],
     },
     classifiers = [
         "Development Status :: 5 - Production/Stable",
@@ -40,19 +40,32 @@ This is expected to fail with an error, so redirecting stdout since we don't car
   [2]
 
 Test output with unmatched expected date formats while warning on failures.
-This is expected to print warnings for failures and return the masked date strings for failures.
+This is expected to print a summary warning of failures and return the masked date strings for failures.
 
   $ cat records.ndjson \
   >   | ${AUGUR} curate format-dates \
   >     --date-fields "date" "collectionDate" "releaseDate" "updateDate" \
   >     --expected-date-formats "%Y" "%Y-%m-%dT%H:%M:%SZ" \
   >     --failure-reporting "warn"
+  WARNING: Unable to format dates for the following (record, field, date string):
+  (0, 'collectionDate', '2020-01')
+  (0, 'releaseDate', '2020-01')
+  {"record": 1, "date": "2020-XX-XX", "collectionDate": "XXXX-XX-XX", "releaseDate": "XXXX-XX-XX", "updateDate": "2020-07-18"}
+
+Test output with unmatched expected date formats while warning on each failure.
+This is expected to print warnings for each failure before the summary warning.
+
+  $ cat records.ndjson \
+  >   | ${AUGUR} curate format-dates \
+  >     --date-fields "date" "collectionDate" "releaseDate" "updateDate" \
+  >     --expected-date-formats "%Y" "%Y-%m-%dT%H:%M:%SZ" \
+  >     --failure-reporting "warn" \
+  >     --warn-each-failure 1> /dev/null
   WARNING: Unable to format date string '2020-01' in field 'collectionDate' of record 0.
   WARNING: Unable to format date string '2020-01' in field 'releaseDate' of record 0.
   WARNING: Unable to format dates for the following (record, field, date string):
   (0, 'collectionDate', '2020-01')
   (0, 'releaseDate', '2020-01')
-  {"record": 1, "date": "2020-XX-XX", "collectionDate": "XXXX-XX-XX", "releaseDate": "XXXX-XX-XX", "updateDate": "2020-07-18"}
 
 Test output with unmatched expected date formats while silencing failures.
 This is expected to return the masked date strings for failures.
@@ -75,6 +88,55 @@ This is expected to return the date strings in their original format.
   >     --no-mask-failure
   {"record": 1, "date": "2020-XX-XX", "collectionDate": "2020-01", "releaseDate": "2020-01", "updateDate": "2020-07-18"}
 
+Test output with a single date field with matching expected date formats.
+
+  $ cat records.ndjson \
+  >   | ${AUGUR} curate format-dates \
+  >     --date-fields "collectionDate" \
+  >     --expected-date-formats "%Y" "%Y-%m"
+  {"record": 1, "date": "2020", "collectionDate": "2020-01-XX", "releaseDate": "2020-01", "updateDate": "2020-07-18T00:00:00Z"}
+
+Test output with a single date field with unmatched expected date formats while silencing failures.
+This is expected to return the masked date string for the failure.
+
+  $ cat records.ndjson \
+  >   | ${AUGUR} curate format-dates \
+  >     --date-fields "collectionDate" \
+  >     --expected-date-formats "%Y" \
+  >     --failure-reporting "silent"
+  {"record": 1, "date": "2020", "collectionDate": "XXXX-XX-XX", "releaseDate": "2020-01", "updateDate": "2020-07-18T00:00:00Z"}
+
+Test output with a single date field with unmatched expected date formats while silencing failures with `--no-mask-failure`.
+This is expected to return the date string in its original format.
+
+  $ cat records.ndjson \
+  >   | ${AUGUR} curate format-dates \
+  >     --date-fields "collectionDate" \
+  >     --expected-date-formats "%Y" \
+  >     --failure-reporting "silent" \
+  >     --no-mask-failure
+  {"record": 1, "date": "2020", "collectionDate": "2020-01", "releaseDate": "2020-01", "updateDate": "2020-07-18T00:00:00Z"}
+
+Test output with a single date field with unmatched expected date formats while warning on failures.
+This is expected to print a summary warning of the failure.
+
+  $ cat records.ndjson \
+  >   | ${AUGUR} curate format-dates \
+  >     --date-fields "collectionDate" \
+  >     --expected-date-formats "%Y" \
+  >     --failure-reporting "warn" 1> /dev/null
+  WARNING: Unable to format dates for the following (record, field, date string):
+  (0, 'collectionDate', '2020-01')
+
+Test output with a single date field with unmatched expected date formats with default `ERROR_FIRST` failure reporting.
+
+  $ cat records.ndjson \
+  >   | ${AUGUR} curate format-dates \
+  >     --date-fields "collectionDate" \
+  >     --expected-date-formats "%Y" 1> /dev/null
+  ERROR: Unable to format date string '2020-01' in field 'collectionDate' of record 0.
+  [2]
+
 Test output with multiple matching expected date formats.
 Date with multiple matches will be parsed according to first matching format.
 The "collectionDate" and "releaseDate" will match the first "%Y-%j" format, which is a complete date.
@@ -5,6 +5,7 @@ from augur.validate import (
     validate_collection_config_fields,
     validate_collection_display_defaults,
     validate_measurements_config,
+    load_json,
     load_json_schema,
     validate_json,
     ValidateError
@@ -93,10 +94,54 @@ class TestValidateMeasurements():
         assert capsys.readouterr().err == "ERROR: The default collection key 'invalid_collection' does not match any of the collections' keys.\n"
 
 
+class TestLoadJson():
+    def test_load_json(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('{"a": [1, 2.5, "x", null, true]}')
+        assert load_json(str(path)) == {"a": [1, 2.5, "x", None, True]}
+
+    def test_load_json_nan(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('{"a": NaN}')
+        value = load_json(str(path))["a"]
+        assert value != value
+
+    def test_load_json_big_integers(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('{"a": [18446744073709551616, -9223372036854775809, 1]}')
+        assert load_json(str(path)) == {"a": [18446744073709551616, -9223372036854775809, 1]}
+
+    def test_load_json_invalid(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('{"a": ')
+        with pytest.raises(ValidateError):
+            load_json(str(path))
+
+    def test_load_json_empty(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('')
+        with pytest.raises(ValidateError):
+            load_json(str(path))
+
+
 @pytest.fixture
 def genome_annotation_schema():
     return load_json_schema("schema-annotations.json")
 
+class TestCompiledValidator():
+    def test_same_errors_as_jsonschema(self, genome_annotation_schema):
+        pytest.importorskip("fastjsonschema")
+        from augur.validate import CompiledValidator
+        assert isinstance(genome_annotation_schema, CompiledValidator)
+
+        valid = {"nuc": {"start": 1, "end": 100}}
+        invalid = {"nuc": {"start": 1, "end": 100}, "cds": {"start": -2, "end": 10, "strand": "+"}}
+
+        assert list(genome_annotation_schema.iter_errors(valid)) == []
+        assert [e.message for e in genome_annotation_schema.iter_errors(invalid)] == \
+            [e.message for e in genome_annotation_schema.validator.iter_errors(invalid)]
+
+
 class TestValidateGenomeAnnotations():
     def test_negative_strand_nuc(self, capsys, genome_annotation_schema):
         d = {"nuc": {"start": 1, "end": 200, "strand": "-"}}
@@ -9,7 +9,7 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from augur.export_v2 import convert_tree_to_json_structure
 from augur.validate import ValidateError
-from augur.validate_export import ensure_no_duplicate_names
+from augur.validate_export import collectTreeV2, ValidationWarnings
 
 
 class TestValidateExport():
@@ -18,7 +18,7 @@ class TestValidateExport():
         tree = Bio.Phylo.read(StringIO("root(A, internal(B, C))"), "newick")
         metadata = {"A": {}, "B": {}, "C": {}, "root": {}, "internal": {}}
         root = convert_tree_to_json_structure(tree.root, metadata, None)
-        ensure_no_duplicate_names(root, ValidateError)
+        collectTreeV2(root, ValidateError)
 
     def test_export_with_duplicate_names(self):
         # Create a tree with duplicate tip names.
@@ -27,4 +27,47 @@ class TestValidateExport():
         root = convert_tree_to_json_structure(tree.root, metadata, None)
 
         with pytest.raises(ValidateError):
-            ensure_no_duplicate_names(root, ValidateError)
+            collectTreeV2(root, ValidateError)
+
+    def test_collect_tree(self):
+        root = {
+            "name": "root",
+            "node_attrs": {"div": 0, "country": {"value": "USA"}},
+            "branch_attrs": {"mutations": {"nuc": ["A1T"]}},
+            "children": [
+                {
+                    "name": "A",
+                    "node_attrs": {"div": 1, "country": {"value": "USA"}, "clade": {"value": "1"}},
+                    "branch_attrs": {"mutations": {"S": ["N501Y"]}, "labels": {"clade": "1"}},
+                },
+                {
+                    "name": "B",
+                    "node_attrs": {"div": 2, "country": {"value": "Mexico"}},
+                    "branch_attrs": {"mutations": {"nuc": ["C2G"], "ORF1a": ["T1I"]}, "labels": {"aa": "ORF1a: T1I"}},
+                },
+            ],
+        }
+        tree_traits, num_terminal, genes, labels = collectTreeV2(root, ValidateError)
+
+        assert num_terminal == 2
+        assert genes == {"S", "ORF1a"}
+        assert labels == {"clade", "aa"}
+
+        # "div" isn't collected since it's not an object with a "value"
+        assert set(tree_traits) == {"country", "clade"}
+        assert tree_traits["country"] == {"count": 3, "values": {"USA", "Mexico"}, "onAllNodes": True}
+        assert tree_traits["clade"] == {"count": 1, "values": {"1"}, "onAllNodes": False}
+
+
+class TestValidationWarnings():
+    def test_show_distinct_warnings_once(self, capsys):
+        warnings = ValidationWarnings()
+        assert not warnings
+
+        warnings.add("first")
+        warnings.add("second")
+        warnings.add("first")
+        assert warnings
+
+        warnings.show()
+        assert capsys.readouterr().err == "\tWARNING:  first\n\tWARNING:  second\n"